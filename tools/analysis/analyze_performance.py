@@ -2,18 +2,29 @@
 # Swift-Guard 성능 분석 스크립트
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # 헤드리스 환경용 비대화형 백엔드
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 import os
-import glob
+import re
 import argparse
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from matplotlib.collections import PolyCollection
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
 
 # 스타일 설정
-sns.set(style="whitegrid")
+plt.style.use('seaborn-v0_8-whitegrid')
 plt.rcParams.update({'font.size': 12})
 plt.rcParams['figure.figsize'] = (12, 8)
+plt.rcParams['path.simplify'] = True
+plt.rcParams['path.simplify_threshold'] = 1.0
+plt.rcParams['agg.path.chunksize'] = 10000
 
 # 인자 파싱
 parser = argparse.ArgumentParser(description='Analyze Swift-Guard performance test results')
@@ -21,171 +32,407 @@ parser.add_argument('--results-dir', type=str, default='./results',
                     help='Directory containing test results (default: ./results)')
 parser.add_argument('--output-dir', type=str, default='./plots',
                     help='Directory for output plots (default: ./plots)')
+parser.add_argument('--force', action='store_true',
+                    help='Regenerate plots even if their input files are unchanged')
 args = parser.parse_args()
 
 # 출력 디렉토리 생성
 os.makedirs(args.output_dir, exist_ok=True)
 
-def analyze_basic_throughput():
-    """기본 처리량 테스트 결과 분석"""
-    print("Analyzing basic throughput results...")
-    
-    # 결과 데이터 로드
-    results_file = os.path.join(args.results_dir, 'throughput_results.csv')
-    if not os.path.exists(results_file):
-        print(f"Error: Results file not found at {results_file}")
+# CSV 로드 시 사용할 컬럼과 타입 (필요한 컬럼만 읽고 타입 추론 생략)
+THROUGHPUT_DTYPES = {'packet_size': 'int32', 'pps': 'float64', 'gbps': 'float32', 'cpu_util': 'float32'}
+STATS_DTYPES = {'packets_per_sec': 'float64', 'mbps': 'float64', 'cpu_util': 'float32'}
+
+# 통계 CSV를 나눠 읽는 단위 (긴 테스트 결과도 메모리 사용량을 일정하게 유지)
+STATS_CHUNK_ROWS = 200_000
+STATS_BLOCK_BYTES = 8 << 20
+
+# 결과 파일 이름 패턴: rules_1000_stats.csv -> 1000, wasm_http_inspector.wasm_stats.csv -> http_inspector
+_FNAME_RE = re.compile(r'^(rules|wasm)_(.+?)(?:\.wasm)?_stats\.csv$')
+
+# WASM 모듈 토큰의 표시 이름 (그 외는 http_inspector -> Http Inspector)
+_WASM_NAMES = {'none': 'No WASM', 'null': 'Null Module'}
+
+def _find_result_files(kind):
+    """결과 디렉토리에서 kind(rules/wasm)에 해당하는 (파일 경로, 이름 토큰) 목록 반환"""
+    if not os.path.isdir(args.results_dir):
+        return []
+    return [(e.path, m.group(2)) for e in os.scandir(args.results_dir)
+            if (m := _FNAME_RE.match(e.name)) and m.group(1) == kind]
+
+def _input_stamp(src_paths):
+    """입력 파일 목록의 스탬프 문자열 생성 (정렬된 절대 경로, mtime, 크기)"""
+    lines = []
+    for path in sorted(os.path.abspath(p) for p in src_paths):
+        st = os.stat(path)
+        lines.append(f"{path}\t{st.st_mtime_ns}\t{st.st_size}\n")
+    return ''.join(lines)
+
+def _up_to_date(src_paths, dst_path):
+    """출력 파일이 존재하고 옆에 저장된 스탬프가 현재 입력 파일 목록과 같은지 확인"""
+    if not os.path.exists(dst_path):
+        return False
+    try:
+        with open(dst_path + '.stamp') as f:
+            return f.read() == _input_stamp(src_paths)
+    except OSError:
+        return False
+
+def _write_stamp(src_paths, dst_path):
+    """출력 파일을 만든 입력 파일 목록의 스탬프 저장"""
+    with open(dst_path + '.stamp', 'w') as f:
+        f.write(_input_stamp(src_paths))
+
+def _csv_columns(path):
+    """CSV 헤더의 컬럼 이름 목록 반환 (데이터를 읽는 것과 같은 파서 사용, BOM 등 처리 동일)"""
+    if pacsv is not None:
+        # 스키마만 필요하므로 첫 블록을 작게 잡아 헤더 부근만 파싱
+        return pacsv.open_csv(path, read_options=pacsv.ReadOptions(block_size=1 << 16)).schema.names
+    return list(pd.read_csv(path, nrows=0).columns)
+
+def _iter_stats_chunks(path, cols):
+    """통계 CSV에서 지정한 컬럼(파일에 존재해야 함)만 청크 단위로 읽어 {컬럼: NumPy 배열} 반환"""
+    if pacsv is not None:
+        # 스트리밍 리더는 첫 블록만 보고 타입을 정하므로 float64로 고정
+        reader = pacsv.open_csv(
+            path,
+            read_options=pacsv.ReadOptions(block_size=STATS_BLOCK_BYTES),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=cols, column_types={c: pa.float64() for c in cols}))
+        for batch in reader:
+            yield {c: batch.column(c).to_numpy(zero_copy_only=False) for c in cols}
         return
+    for chunk in pd.read_csv(path, usecols=cols, dtype=STATS_DTYPES, chunksize=STATS_CHUNK_ROWS):
+        yield {c: chunk[c].to_numpy() for c in cols}
+
+def _sum_count_max_loop(values):
+    """NaN을 제외한 합계/개수/최대값 계산 (Numba JIT 컴파일 대상 루프)"""
+    total = 0.0
+    count = 0
+    peak = -np.inf
+    for i in range(values.shape[0]):
+        x = values[i]
+        if not np.isnan(x):
+            total += x
+            count += 1
+            peak = max(peak, x)
+    return total, count, peak
+
+def _sum_count_max_numpy(values):
+    """NaN을 제외한 합계/개수/최대값 계산 (Numba 미설치 시 NumPy 사용)"""
+    valid = values[~np.isnan(values)]
+    if valid.size == 0:
+        return 0.0, 0, -np.inf
+    return valid.sum(), valid.size, valid.max()
+
+_sum_count_max_impl = None
+
+def _sum_count_max(values):
+    """NaN을 제외한 합계/개수/최대값 계산
+    
+    Numba는 첫 호출 시점에 임포트한다 (통계 파일이 없는 실행과 시작 시간에는 영향 없음).
+    프로세스 풀 작업자 안에서 실행되므로 단일 스레드로 컴파일한다 (parallel=True면 코어 수^2 스레드).
+    """
+    global _sum_count_max_impl
+    if _sum_count_max_impl is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _sum_count_max_impl = _sum_count_max_numpy
+        else:
+            _sum_count_max_impl = njit(cache=True)(_sum_count_max_loop)
+    return _sum_count_max_impl(values)
+
+def _summarize_stats(path, cols):
+    """통계 CSV를 스트리밍하며 컬럼별 (평균, 최대) 계산 (파일에 없는 컬럼은 (0, 0), 값이 없는 컬럼은 NaN)"""
+    totals = dict.fromkeys(cols, 0.0)
+    counts = dict.fromkeys(cols, 0)
+    peaks = dict.fromkeys(cols, -np.inf)
+    header = _csv_columns(path)
+    present = [c for c in cols if c in header]
+    for chunk in _iter_stats_chunks(path, present):
+        for col, values in chunk.items():
+            total, count, peak = _sum_count_max(np.ascontiguousarray(values, dtype=np.float64))
+            totals[col] += total
+            counts[col] += count
+            peaks[col] = max(peaks[col], peak)
+    summary = {}
+    for col in cols:
+        if col not in present:
+            summary[col] = (0, 0)
+        elif counts[col] == 0:
+            summary[col] = (np.nan, np.nan)
+        else:
+            summary[col] = (totals[col] / counts[col], peaks[col])
+    return summary
+
+def _summarize_rule_file(path, token):
+    """규칙 스케일링 결과 파일 하나의 평균/최대 성능 요약 (프로세스 풀 작업 함수)"""
+    # 파일 이름에서, rules_1000_stats.csv -> 1000 추출
+    try:
+        rule_count = int(token)
+        stats = _summarize_stats(path, ['packets_per_sec', 'mbps'])
+    except ValueError as e:
+        print(f"Error processing file {path}: {e}")
+        return None
+    
+    avg_pps, max_pps = stats['packets_per_sec']
+    avg_mbps, max_mbps = stats['mbps']
+    return {
+        'rule_count': rule_count,
+        'avg_pps': avg_pps,
+        'avg_mbps': avg_mbps,
+        'max_pps': max_pps,
+        'max_mbps': max_mbps,
+    }
+
+def _summarize_wasm_file(path, module_name):
+    """WASM 오버헤드 결과 파일 하나의 평균 성능 요약 (프로세스 풀 작업 함수)"""
+    try:
+        stats = _summarize_stats(path, ['packets_per_sec', 'mbps', 'cpu_util'])
+    except ValueError as e:
+        print(f"Error processing file {path}: {e}")
+        return None
+    
+    return {
+        'module': module_name,
+        'avg_pps': stats['packets_per_sec'][0],
+        'avg_mbps': stats['mbps'][0],
+        'avg_cpu': stats['cpu_util'][0],
+    }
+
+def _wasm_module_name(token):
+    """WASM 결과 파일 토큰을 표시용 모듈 이름으로 변환"""
+    return _WASM_NAMES.get(token, token.replace('_', ' ').title())
+
+def _load_stats_dir(kind, label, summarize, name_parser=None):
+    """kind(rules/wasm) 통계 파일을 모두 찾아 파일별 요약을 데이터프레임으로 반환
+    
+    요약은 프로세스 풀에서 병렬로 계산하며 실패한 파일은 제외한다.
+    결과 파일 또는 유효한 데이터가 없으면 (None, 파일 목록)을 반환한다.
+    """
+    pattern = os.path.join(args.results_dir, f'{kind}_*_stats.csv')
+    entries = _find_result_files(kind)
+    if not entries:
+        print(f"No {label} test results found matching pattern {pattern}")
+        return None, []
+    
+    files = [path for path, _ in entries]
+    names = [name_parser(token) if name_parser else token for _, token in entries]
+    with ProcessPoolExecutor(max_workers=min(len(files), os.cpu_count() or 1)) as pool:
+        results = [r for r in pool.map(summarize, files, names, chunksize=4) if r is not None]
     
-    df = pd.read_csv(results_file)
-    print(f"Loaded data with {len(df)} packet size tests")
-    print(df)
+    if not results:
+        print(f"No valid data found in {label} test results")
+        return None, files
+    return pd.DataFrame(results), files
+
+def _plot_basic_throughput(df, output_file):
+    """기본 처리량 그래프 생성"""
+    ps = df['packet_size'].to_numpy()
+    mpps = df['pps'].to_numpy() / 1e6
+    gbps = df['gbps'].to_numpy()
+    cpu = df['cpu_util'].to_numpy()
     
     # 처리량 그래프
-    plt.figure(figsize=(15, 10))
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
     
     # PPS vs 패킷 크기
-    plt.subplot(2, 2, 1)
-    plt.plot(df['packet_size'], df['pps'] / 1e6, 'o-', linewidth=2, markersize=8)
-    plt.xlabel('Packet Size (bytes)')
-    plt.ylabel('Million Packets Per Second (Mpps)')
-    plt.title('Packet Throughput vs Packet Size')
-    plt.grid(True)
+    ax1.plot(ps, mpps, 'o-', linewidth=2, markersize=8)
+    ax1.set_xlabel('Packet Size (bytes)')
+    ax1.set_ylabel('Million Packets Per Second (Mpps)')
+    ax1.set_title('Packet Throughput vs Packet Size')
+    ax1.grid(True)
     
     # Gbps vs 패킷 크기
-    plt.subplot(2, 2, 2)
-    plt.plot(df['packet_size'], df['gbps'], 'o-', linewidth=2, color='orange', markersize=8)
-    plt.xlabel('Packet Size (bytes)')
-    plt.ylabel('Throughput (Gbps)')
-    plt.title('Bandwidth vs Packet Size')
-    plt.grid(True)
+    ax2.plot(ps, gbps, 'o-', linewidth=2, color='orange', markersize=8)
+    ax2.set_xlabel('Packet Size (bytes)')
+    ax2.set_ylabel('Throughput (Gbps)')
+    ax2.set_title('Bandwidth vs Packet Size')
+    ax2.grid(True)
     
     # CPU 사용률 vs 패킷 크기
-    plt.subplot(2, 2, 3)
-    plt.plot(df['packet_size'], df['cpu_util'], 'o-', linewidth=2, color='green', markersize=8)
-    plt.xlabel('Packet Size (bytes)')
-    plt.ylabel('CPU Utilization (%)')
-    plt.title('CPU Usage vs Packet Size')
-    plt.grid(True)
+    ax3.plot(ps, cpu, 'o-', linewidth=2, color='green', markersize=8)
+    ax3.set_xlabel('Packet Size (bytes)')
+    ax3.set_ylabel('CPU Utilization (%)')
+    ax3.set_title('CPU Usage vs Packet Size')
+    ax3.grid(True)
     
     # PPS와 Gbps 비교 (로그 스케일)
-    plt.subplot(2, 2, 4)
-    ax1 = plt.gca()
-    ax2 = ax1.twinx()
+    ax4b = ax4.twinx()
     
-    line1 = ax1.semilogx(df['packet_size'], df['pps'] / 1e6, 'o-', linewidth=2, color='blue', markersize=8, label='Mpps')
-    line2 = ax2.semilogx(df['packet_size'], df['gbps'], 'o-', linewidth=2, color='red', markersize=8, label='Gbps')
+    line1 = ax4.semilogx(ps, mpps, 'o-', linewidth=2, color='blue', markersize=8, label='Mpps', rasterized=True)
+    line2 = ax4b.semilogx(ps, gbps, 'o-', linewidth=2, color='red', markersize=8, label='Gbps', rasterized=True)
     
-    ax1.set_xlabel('Packet Size (bytes) - Log Scale')
-    ax1.set_ylabel('Million Packets Per Second (Mpps)', color='blue')
-    ax2.set_ylabel('Throughput (Gbps)', color='red')
-    ax1.tick_params(axis='y', labelcolor='blue')
-    ax2.tick_params(axis='y', labelcolor='red')
-    plt.title('Performance Metrics vs Packet Size (Log Scale)')
+    ax4.set_xlabel('Packet Size (bytes) - Log Scale')
+    ax4.set_ylabel('Million Packets Per Second (Mpps)', color='blue')
+    ax4b.set_ylabel('Throughput (Gbps)', color='red')
+    ax4.tick_params(axis='y', labelcolor='blue')
+    ax4b.tick_params(axis='y', labelcolor='red')
+    ax4.set_title('Performance Metrics vs Packet Size (Log Scale)')
     
     # 두 축에 대한 레전드 통합
     lines = line1 + line2
     labels = [l.get_label() for l in lines]
-    plt.legend(lines, labels, loc='upper center')
+    ax4b.legend(lines, labels, loc='upper center')
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(args.output_dir, 'basic_throughput.png'), dpi=300)
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=300)
+    plt.close(fig)
+
+def _plot_rule_scaling(result_df, output_file):
+    """규칙 스케일링 그래프 생성"""
+    # 규칙 수에 따른 성능 그래프 (네 그래프 모두 같은 로그 스케일 x축 공유)
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10), sharex=True)
+    ax1.set_xscale('log')
+    ax1.tick_params(axis='x', labelbottom=True)
+    ax2.tick_params(axis='x', labelbottom=True)
     
-    # 요약 통계 출력
-    print("\nPerformance Summary:")
-    print(f"Maximum packet rate: {df['pps'].max() / 1e6:.2f} Mpps (at {df.loc[df['pps'].idxmax(), 'packet_size']} bytes)")
-    print(f"Maximum bandwidth: {df['gbps'].max():.2f} Gbps (at {df.loc[df['gbps'].idxmax(), 'packet_size']} bytes)")
-    print(f"Average CPU utilization: {df['cpu_util'].mean():.2f}%")
+    # 평균 PPS vs 규칙 수
+    ax1.plot(result_df['rule_count'], result_df['avg_pps'] / 1e6, 'o-', linewidth=2, markersize=8)
+    ax1.set_xlabel('Number of Rules')
+    ax1.set_ylabel('Average Million Packets Per Second (Mpps)')
+    ax1.set_title('Packet Throughput vs Rule Count')
+    ax1.grid(True)
     
-def analyze_rule_scaling():
-    """규칙 스케일링 테스트 결과 분석"""
-    print("\nAnalyzing rule scaling results...")
+    # 최대 PPS vs 규칙 수
+    ax2.plot(result_df['rule_count'], result_df['max_pps'] / 1e6, 'o-', linewidth=2, color='orange', markersize=8)
+    ax2.set_xlabel('Number of Rules')
+    ax2.set_ylabel('Maximum Million Packets Per Second (Mpps)')
+    ax2.set_title('Peak Packet Throughput vs Rule Count')
+    ax2.grid(True)
     
-    # 결과 파일 찾기
-    pattern = os.path.join(args.results_dir, 'rules_*_stats.csv')
-    rule_files = glob.glob(pattern)
+    # 평균 Mbps vs 규칙 수
+    ax3.plot(result_df['rule_count'], result_df['avg_mbps'] / 1e3, 'o-', linewidth=2, color='green', markersize=8)
+    ax3.set_xlabel('Number of Rules')
+    ax3.set_ylabel('Average Throughput (Gbps)')
+    ax3.set_title('Average Bandwidth vs Rule Count')
+    ax3.grid(True)
     
-    if not rule_files:
-        print(f"No rule scaling test results found matching pattern {pattern}")
-        return
+    # 정규화된 성능 vs 규칙 수
+    # 최대값으로 정규화
+    norm_pps = result_df['avg_pps'] / result_df['avg_pps'].iloc[0] * 100
+    norm_mbps = result_df['avg_mbps'] / result_df['avg_mbps'].iloc[0] * 100
     
-    # 각 파일에서 규칙 수 추출 및 데이터 로드
-    results = []
-    for file in rule_files:
-        # 파일 이름에서, rules_1000_stats.csv -> 1000 추출
-        try:
-            rule_count = int(Path(file).stem.split('_')[1])
-            df = pd.read_csv(file)
-            
-            # 평균 성능 계산
-            results.append({
-                'rule_count': rule_count,
-                'avg_pps': df['packets_per_sec'].mean() if 'packets_per_sec' in df.columns else 0,
-                'avg_mbps': df['mbps'].mean() if 'mbps' in df.columns else 0,
-                'max_pps': df['packets_per_sec'].max() if 'packets_per_sec' in df.columns else 0,
-                'max_mbps': df['mbps'].max() if 'mbps' in df.columns else 0,
-            })
-        except (IndexError, ValueError) as e:
-            print(f"Error processing file {file}: {e}")
+    ax4.plot(result_df['rule_count'], norm_pps, 'o-', linewidth=2, color='blue', markersize=8, label='PPS')
+    ax4.plot(result_df['rule_count'], norm_mbps, 'o-', linewidth=2, color='red', markersize=8, label='Mbps')
+    ax4.set_xlabel('Number of Rules (Log Scale)')
+    ax4.set_ylabel('Normalized Performance (%)')
+    ax4.set_title('Scaling Efficiency vs Rule Count')
+    ax4.grid(True)
+    ax4.legend()
+    
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=300)
+    plt.close(fig)
+
+def _plot_wasm_overhead(result_df, output_file):
+    """WASM 모듈 오버헤드 그래프 생성"""
+    # WASM 모듈에 따른 성능 그래프
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
     
-    if not results:
-        print("No valid data found in rule scaling test results")
-        return
+    # 모듈별 PPS
+    bars = ax1.bar(result_df['module'], result_df['avg_pps'] / 1e6, color='skyblue')
+    ax1.set_xlabel('WASM Module Type')
+    ax1.set_ylabel('Million Packets Per Second (Mpps)')
+    ax1.set_title('Packet Throughput vs WASM Module')
+    ax1.tick_params(axis='x', labelrotation=45)
+    ax1.grid(axis='y')
     
-    # 결과를 데이터프레임으로 변환 및 정렬
-    result_df = pd.DataFrame(results).sort_values('rule_count')
-    print(f"Loaded data for {len(result_df)} rule counts")
-    print(result_df)
+    # 기준(No WASM) 대비 오버헤드 표시
+    if 'overhead_pct' in result_df.columns:
+        labels = [f'{o:.1f}%' if m != 'No WASM' else ''
+                  for o, m in zip(result_df['overhead_pct'].to_numpy(), result_df['module'])]
+        ax1.bar_label(bars, labels=labels, padding=3)
     
-    # 규칙 수에 따른 성능 그래프
-    plt.figure(figsize=(15, 10))
+    # 모듈별 Gbps
+    ax2.bar(result_df['module'], result_df['avg_mbps'] / 1e3, color='orange')
+    ax2.set_xlabel('WASM Module Type')
+    ax2.set_ylabel('Throughput (Gbps)')
+    ax2.set_title('Bandwidth vs WASM Module')
+    ax2.tick_params(axis='x', labelrotation=45)
+    ax2.grid(axis='y')
     
-    # 평균 PPS vs 규칙 수
-    plt.subplot(2, 2, 1)
-    plt.plot(result_df['rule_count'], result_df['avg_pps'] / 1e6, 'o-', linewidth=2, markersize=8)
-    plt.xlabel('Number of Rules')
-    plt.ylabel('Average Million Packets Per Second (Mpps)')
-    plt.title('Packet Throughput vs Rule Count')
-    plt.grid(True)
-    plt.xscale('log')
+    # 모듈별 CPU 사용률
+    ax3.bar(result_df['module'], result_df['avg_cpu'], color='salmon')
+    ax3.set_xlabel('WASM Module Type')
+    ax3.set_ylabel('CPU Utilization (%)')
+    ax3.set_title('CPU Usage vs WASM Module')
+    ax3.tick_params(axis='x', labelrotation=45)
+    ax3.grid(axis='y')
     
-    # 최대 PPS vs 규칙 수
-    plt.subplot(2, 2, 2)
-    plt.plot(result_df['rule_count'], result_df['max_pps'] / 1e6, 'o-', linewidth=2, color='orange', markersize=8)
-    plt.xlabel('Number of Rules')
-    plt.ylabel('Maximum Million Packets Per Second (Mpps)')
-    plt.title('Peak Packet Throughput vs Rule Count')
-    plt.grid(True)
-    plt.xscale('log')
+    # 상대적 성능 비교
+    if 'overhead_pct' in result_df.columns:
+        ax4.bar(result_df['module'], result_df['efficiency'], color='green')
+        ax4.axhline(y=100, color='red', linestyle='--', label='Baseline (No WASM)')
+        ax4.set_xlabel('WASM Module Type')
+        ax4.set_ylabel('Relative Efficiency (%)')
+        ax4.set_title('Performance Efficiency vs WASM Module')
+        ax4.tick_params(axis='x', labelrotation=45)
+        ax4.grid(axis='y')
+        ax4.legend()
+    
+    fig.tight_layout()
+    fig.savefig(output_file, dpi=300)
+    plt.close(fig)
+
+def analyze_basic_throughput():
+    """기본 처리량 테스트 결과 분석"""
+    print("Analyzing basic throughput results...")
     
-    # 평균 Mbps vs 규칙 수
-    plt.subplot(2, 2, 3)
-    plt.plot(result_df['rule_count'], result_df['avg_mbps'] / 1e3, 'o-', linewidth=2, color='green', markersize=8)
-    plt.xlabel('Number of Rules')
-    plt.ylabel('Average Throughput (Gbps)')
-    plt.title('Average Bandwidth vs Rule Count')
-    plt.grid(True)
-    plt.xscale('log')
+    # 결과 데이터 로드
+    results_file = os.path.join(args.results_dir, 'throughput_results.csv')
+    if not os.path.exists(results_file):
+        print(f"Error: Results file not found at {results_file}")
+        return None
     
-    # 정규화된 성능 vs 규칙 수
-    plt.subplot(2, 2, 4)
+    df = pd.read_csv(results_file, usecols=list(THROUGHPUT_DTYPES), dtype=THROUGHPUT_DTYPES)
+    print(f"Loaded data with {len(df)} packet size tests")
+    print(df)
     
-    # 최대값으로 정규화
-    norm_pps = result_df['avg_pps'] / result_df['avg_pps'].iloc[0] * 100
-    norm_mbps = result_df['avg_mbps'] / result_df['avg_mbps'].iloc[0] * 100
+    # 그래프 생성 (입력 CSV가 바뀌지 않았으면 건너뜀)
+    output_file = os.path.join(args.output_dir, 'basic_throughput.png')
+    sources = [results_file, __file__]
+    if args.force or not _up_to_date(sources, output_file):
+        _plot_basic_throughput(df, output_file)
+        _write_stamp(sources, output_file)
+    else:
+        print(f"Plot {output_file} is up to date, skipping")
     
-    plt.plot(result_df['rule_count'], norm_pps, 'o-', linewidth=2, color='blue', markersize=8, label='PPS')
-    plt.plot(result_df['rule_count'], norm_mbps, 'o-', linewidth=2, color='red', markersize=8, label='Mbps')
-    plt.xlabel('Number of Rules (Log Scale)')
-    plt.ylabel('Normalized Performance (%)')
-    plt.title('Scaling Efficiency vs Rule Count')
-    plt.grid(True)
-    plt.xscale('log')
-    plt.legend()
+    # 요약 통계 출력
+    ps = df['packet_size'].to_numpy()
+    pps = df['pps'].to_numpy()
+    gbps = df['gbps'].to_numpy()
+    cpu = df['cpu_util'].to_numpy()
+    print("\nPerformance Summary:")
+    print(f"Maximum packet rate: {pps.max() / 1e6:.2f} Mpps (at {ps[pps.argmax()]} bytes)")
+    print(f"Maximum bandwidth: {gbps.max():.2f} Gbps (at {ps[gbps.argmax()]} bytes)")
+    print(f"Average CPU utilization: {cpu.mean():.2f}%")
     
-    plt.tight_layout()
-    plt.savefig(os.path.join(args.output_dir, 'rule_scaling.png'), dpi=300)
-    plt.close()
+    return df
+
+def analyze_rule_scaling():
+    """규칙 스케일링 테스트 결과 분석"""
+    print("\nAnalyzing rule scaling results...")
+    
+    # 각 파일의 규칙 수별 성능 요약
+    result_df, files = _load_stats_dir('rules', 'rule scaling', _summarize_rule_file)
+    if result_df is None:
+        return None
+    
+    # 규칙 수 기준 정렬
+    result_df = result_df.sort_values('rule_count', ignore_index=True)
+    print(f"Loaded data for {len(result_df)} rule counts")
+    print(result_df)
+    
+    # 그래프 생성 (입력 CSV가 바뀌지 않았으면 건너뜀)
+    output_file = os.path.join(args.output_dir, 'rule_scaling.png')
+    sources = [*files, __file__]
+    if args.force or not _up_to_date(sources, output_file):
+        _plot_rule_scaling(result_df, output_file)
+        _write_stamp(sources, output_file)
+    else:
+        print(f"Plot {output_file} is up to date, skipping")
     
     # 요약 통계 출력
     print("\nRule Scaling Summary:")
@@ -202,129 +449,48 @@ def analyze_rule_scaling():
         
         print(f"Performance reduction from {min_rules} rules to {max_rules} rules: {pps_reduction:.2f}%")
         print(f"Average performance per rule added: {pps_reduction / (max_rules - min_rules):.6f}% reduction per rule")
+    
+    return result_df
 
 def analyze_wasm_overhead():
     """WASM 모듈 오버헤드 테스트 결과 분석"""
     print("\nAnalyzing WASM module overhead results...")
     
-    # 결과 파일 찾기
-    pattern = os.path.join(args.results_dir, 'wasm_*_stats.csv')
-    wasm_files = glob.glob(pattern)
-    
-    if not wasm_files:
-        print(f"No WASM overhead test results found matching pattern {pattern}")
-        return
-    
-    # 각 파일에서 모듈 이름 추출 및 데이터 로드
-    results = []
-    for file in wasm_files:
-        # 파일 이름에서 모듈 이름 추출
-        try:
-            module_name = Path(file).stem.split('_')[1]
-            if module_name == "none":
-                module_name = "No WASM"
-            elif module_name == "null":
-                module_name = "Null Module"
-            elif module_name.endswith(".wasm"):
-                module_name = module_name[:-5].replace("_", " ").title()
-            
-            df = pd.read_csv(file)
-            
-            # 평균 성능 계산
-            results.append({
-                'module': module_name,
-                'avg_pps': df['packets_per_sec'].mean() if 'packets_per_sec' in df.columns else 0,
-                'avg_mbps': df['mbps'].mean() if 'mbps' in df.columns else 0,
-                'avg_cpu': df['cpu_util'].mean() if 'cpu_util' in df.columns else 0,
-            })
-        except (IndexError, ValueError) as e:
-            print(f"Error processing file {file}: {e}")
-    
-    if not results:
-        print("No valid data found in WASM overhead test results")
-        return
+    # 각 모듈의 성능 요약 (파일 이름에서 모듈 이름 추출)
+    result_df, files = _load_stats_dir('wasm', 'WASM overhead', _summarize_wasm_file, _wasm_module_name)
+    if result_df is None:
+        return None
     
-    # 결과를 데이터프레임으로 변환
-    result_df = pd.DataFrame(results)
     print(f"Loaded data for {len(result_df)} WASM modules")
     print(result_df)
     
-    # WASM 모듈에 따른 성능 그래프
-    plt.figure(figsize=(15, 10))
-    
-    # 모듈별 PPS
-    plt.subplot(2, 2, 1)
-    bars = plt.bar(result_df['module'], result_df['avg_pps'] / 1e6, color='skyblue')
-    plt.xlabel('WASM Module Type')
-    plt.ylabel('Million Packets Per Second (Mpps)')
-    plt.title('Packet Throughput vs WASM Module')
-    plt.xticks(rotation=45)
-    plt.grid(axis='y')
-    
-    # 기준(No WASM) 대비 오버헤드 표시
-    if 'No WASM' in result_df['module'].values:
-        baseline = result_df.loc[result_df['module'] == 'No WASM', 'avg_pps'].values[0]
-        for i, bar in enumerate(bars):
-            if result_df.iloc[i]['module'] != 'No WASM':
-                overhead = ((baseline - result_df.iloc[i]['avg_pps']) / baseline) * 100
-                plt.text(bar.get_x() + bar.get_width()/2., 
-                         bar.get_height() + 0.05 * (result_df['avg_pps'] / 1e6).max(),
-                         f'{overhead:.1f}%',
-                         ha='center', va='bottom', rotation=0)
-    
-    # 모듈별 Gbps
-    plt.subplot(2, 2, 2)
-    plt.bar(result_df['module'], result_df['avg_mbps'] / 1e3, color='orange')
-    plt.xlabel('WASM Module Type')
-    plt.ylabel('Throughput (Gbps)')
-    plt.title('Bandwidth vs WASM Module')
-    plt.xticks(rotation=45)
-    plt.grid(axis='y')
-    
-    # 모듈별 CPU 사용률
-    plt.subplot(2, 2, 3)
-    plt.bar(result_df['module'], result_df['avg_cpu'], color='salmon')
-    plt.xlabel('WASM Module Type')
-    plt.ylabel('CPU Utilization (%)')
-    plt.title('CPU Usage vs WASM Module')
-    plt.xticks(rotation=45)
-    plt.grid(axis='y')
-    
-    # 상대적 성능 비교
-    plt.subplot(2, 2, 4)
-    if 'No WASM' in result_df['module'].values:
-        baseline_idx = result_df[result_df['module'] == 'No WASM'].index[0]
-        baseline_pps = result_df.loc[baseline_idx, 'avg_pps']
-        baseline_cpu = result_df.loc[baseline_idx, 'avg_cpu']
-        
-        # 효율성 계산 (PPS/CPU)
-        result_df['efficiency'] = (result_df['avg_pps'] / result_df['avg_cpu']) / (baseline_pps / baseline_cpu) * 100
-        
-        plt.bar(result_df['module'], result_df['efficiency'], color='green')
-        plt.axhline(y=100, color='red', linestyle='--', label='Baseline (No WASM)')
-        plt.xlabel('WASM Module Type')
-        plt.ylabel('Relative Efficiency (%)')
-        plt.title('Performance Efficiency vs WASM Module')
-        plt.xticks(rotation=45)
-        plt.grid(axis='y')
-        plt.legend()
-    
-    plt.tight_layout()
-    plt.savefig(os.path.join(args.output_dir, 'wasm_overhead.png'), dpi=300)
-    plt.close()
+    # 기준(No WASM) 대비 오버헤드 및 효율성(PPS/CPU) 계산
+    has_baseline = 'No WASM' in result_df['module'].values
+    if has_baseline:
+        baseline = result_df.loc[result_df['module'] == 'No WASM'].iloc[0]
+        result_df['overhead_pct'] = (baseline['avg_pps'] - result_df['avg_pps']) / baseline['avg_pps'] * 100
+        result_df['cpu_increase'] = result_df['avg_cpu'] - baseline['avg_cpu']
+        result_df['efficiency'] = (result_df['avg_pps'] / result_df['avg_cpu']) / (baseline['avg_pps'] / baseline['avg_cpu']) * 100
+    
+    # 그래프 생성 (입력 CSV가 바뀌지 않았으면 건너뜀)
+    output_file = os.path.join(args.output_dir, 'wasm_overhead.png')
+    sources = [*files, __file__]
+    if args.force or not _up_to_date(sources, output_file):
+        _plot_wasm_overhead(result_df, output_file)
+        _write_stamp(sources, output_file)
+    else:
+        print(f"Plot {output_file} is up to date, skipping")
     
     # 요약 통계 출력
     print("\nWASM Overhead Summary:")
-    if 'No WASM' in result_df['module'].values:
-        no_wasm = result_df.loc[result_df['module'] == 'No WASM'].iloc[0]
-        for _, row in result_df[result_df['module'] != 'No WASM'].iterrows():
-            pps_overhead = ((no_wasm['avg_pps'] - row['avg_pps']) / no_wasm['avg_pps']) * 100
-            cpu_increase = row['avg_cpu'] - no_wasm['avg_cpu']
-            
-            print(f"{row['module']} module:")
-            print(f"  - Throughput reduction: {pps_overhead:.2f}%")
-            print(f"  - CPU usage increase: {cpu_increase:.2f} percentage points")
-            print(f"  - Relative efficiency: {row.get('efficiency', 0):.2f}%")
+    if has_baseline:
+        for row in result_df[result_df['module'] != 'No WASM'].itertuples(index=False):
+            print(f"{row.module} module:")
+            print(f"  - Throughput reduction: {row.overhead_pct:.2f}%")
+            print(f"  - CPU usage increase: {row.cpu_increase:.2f} percentage points")
+            print(f"  - Relative efficiency: {row.efficiency:.2f}%")
+    
+    return result_df
 
 def create_solution_comparison():
     """타 솔루션과의 비교 차트 생성"""
@@ -351,19 +517,20 @@ def create_solution_comparison():
     N = len(categories)
     
     # 각 카테고리의 각도 계산
-    angles = [n / float(N) * 2 * np.pi for n in range(N)]
-    angles += angles[:1]  # 폐곡선을 위한 반복
+    angles = np.linspace(0, 2 * np.pi, N, endpoint=False)
+    angles = np.concatenate([angles, angles[:1]])  # 폐곡선을 위한 반복
+    
+    # 솔루션별 값을 (솔루션 수, N+1) 배열로 구성
+    values = df.loc[solutions].to_numpy()
+    values = np.concatenate([values, values[:, :1]], axis=1)  # 폐곡선을 위한 반복
     
     # 그래프 설정
     fig, ax = plt.subplots(figsize=(10, 10), subplot_kw=dict(polar=True))
     
-    # 각 솔루션에 대한 플롯
-    for i, solution in enumerate(solutions):
-        values = df.loc[solution].values.tolist()
-        values += values[:1]  # 폐곡선을 위한 반복
-        
-        ax.plot(angles, values, linewidth=2, linestyle='solid', label=solution)
-        ax.fill(angles, values, alpha=0.1)
+    # 전체 솔루션을 한 번에 플롯하고 영역은 하나의 PolyCollection으로 채움
+    lines = ax.plot(angles, values.T, linewidth=2, linestyle='solid')
+    ax.add_collection(PolyCollection([np.column_stack([angles, v]) for v in values],
+                                     facecolors=[line.get_color() for line in lines], alpha=0.1))
     
     # 축 설정
     plt.xticks(angles[:-1], categories)
@@ -373,7 +540,7 @@ def create_solution_comparison():
     plt.ylim(0, 10)
     
     # 레전드
-    plt.legend(loc='upper right', bbox_to_anchor=(0.1, 0.1))
+    ax.legend(lines, solutions, loc='upper right', bbox_to_anchor=(0.1, 0.1))
     plt.title('Comparison of Network Security Solutions', size=15, y=1.1)
     
     plt.tight_layout()
@@ -382,157 +549,123 @@ def create_solution_comparison():
     
     print("Generated solution comparison radar chart")
 
-def generate_summary_report():
-    """결과 요약 보고서 생성"""
+def generate_summary_report(throughput_df=None, rule_df=None, wasm_df=None):
+    """결과 요약 보고서 생성 (analyze_* 함수가 반환한 데이터프레임 사용)"""
     print("\nGenerating summary report...")
     
     # 마크다운 파일 생성
     report_file = os.path.join(args.output_dir, 'performance_summary.md')
     
-    with open(report_file, 'w') as f:
-        f.write("# Swift-Guard Performance Test Results\n\n")
-        f.write(f"Report generated at: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    parts = []
+    parts.append("# Swift-Guard Performance Test Results\n\n")
+    parts.append(f"Report generated at: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    
+    parts.append("## Basic Throughput Test\n\n")
+    
+    # 기본 처리량 테스트 결과
+    if throughput_df is not None:
+        ps = throughput_df['packet_size'].to_numpy()
+        pps = throughput_df['pps'].to_numpy()
+        gbps = throughput_df['gbps'].to_numpy()
+        cpu = throughput_df['cpu_util'].to_numpy()
         
-        f.write("## Basic Throughput Test\n\n")
+        parts.append("### Summary\n\n")
+        parts.append(f"- Maximum packet rate: {pps.max() / 1e6:.2f} Mpps (at {ps[pps.argmax()]} bytes)\n")
+        parts.append(f"- Maximum bandwidth: {gbps.max():.2f} Gbps (at {ps[gbps.argmax()]} bytes)\n")
+        parts.append(f"- Average CPU utilization: {cpu.mean():.2f}%\n\n")
         
-        # 기본 처리량 테스트 결과 로드
-        throughput_file = os.path.join(args.results_dir, 'throughput_results.csv')
-        if os.path.exists(throughput_file):
-            df = pd.read_csv(throughput_file)
-            
-            f.write("### Summary\n\n")
-            f.write(f"- Maximum packet rate: {df['pps'].max() / 1e6:.2f} Mpps (at {df.loc[df['pps'].idxmax(), 'packet_size']} bytes)\n")
-            f.write(f"- Maximum bandwidth: {df['gbps'].max():.2f} Gbps (at {df.loc[df['gbps'].idxmax(), 'packet_size']} bytes)\n")
-            f.write(f"- Average CPU utilization: {df['cpu_util'].mean():.2f}%\n\n")
-            
-            f.write("### Results by Packet Size\n\n")
-            f.write("| Packet Size (bytes) | Throughput (Mpps) | Bandwidth (Gbps) | CPU Utilization (%) |\n")
-            f.write("|----------------------|-------------------|------------------|---------------------|\n")
-            
-            for _, row in df.iterrows():
-                f.write(f"| {row['packet_size']:20} | {row['pps']/1e6:17.2f} | {row['gbps']:16.2f} | {row['cpu_util']:19.2f} |\n")
-            
-            f.write("\n![Basic Throughput](basic_throughput.png)\n\n")
-        else:
-            f.write("No basic throughput test results found.\n\n")
+        parts.append("### Results by Packet Size\n\n")
+        table = pd.DataFrame({
+            'Packet Size (bytes)': ps,
+            'Throughput (Mpps)': pps / 1e6,
+            'Bandwidth (Gbps)': gbps,
+            'CPU Utilization (%)': cpu,
+        })
+        parts.append(table.to_markdown(index=False, floatfmt=('.0f', '.2f', '.2f', '.2f')) + "\n")
         
-        f.write("## Rule Scaling Test\n\n")
+        parts.append("\n![Basic Throughput](basic_throughput.png)\n\n")
+    else:
+        parts.append("No basic throughput test results found.\n\n")
+    
+    parts.append("## Rule Scaling Test\n\n")
+    
+    # 규칙 스케일링 테스트 결과
+    if rule_df is not None:
+        result_df = rule_df
         
-        # 규칙 스케일링 테스트 결과 로드
-        rule_files = glob.glob(os.path.join(args.results_dir, 'rules_*_stats.csv'))
-        if rule_files:
-            f.write("### Summary\n\n")
-            f.write("The impact of increasing filter rules on performance:\n\n")
-            
-            # 결과 처리를 위한 코드 (이전에 작성한 분석 코드 활용)
-            results = []
-            for file in rule_files:
-                try:
-                    rule_count = int(Path(file).stem.split('_')[1])
-                    df = pd.read_csv(file)
-                    results.append({
-                        'rule_count': rule_count,
-                        'avg_pps': df['packets_per_sec'].mean() if 'packets_per_sec' in df.columns else 0,
-                        'avg_mbps': df['mbps'].mean() if 'mbps' in df.columns else 0,
-                    })
-                except (IndexError, ValueError):
-                    continue
-            
-            if results:
-                result_df = pd.DataFrame(results).sort_values('rule_count')
-                
-                f.write("| Rule Count | Throughput (Mpps) | Bandwidth (Gbps) |\n")
-                f.write("|------------|-------------------|------------------|\n")
-                
-                for _, row in result_df.iterrows():
-                    f.write(f"| {row['rule_count']:10} | {row['avg_pps']/1e6:17.2f} | {row['avg_mbps']/1e3:16.2f} |\n")
-                
-                # 성능 영향 계산
-                if len(result_df) > 1:
-                    min_rules = result_df['rule_count'].min()
-                    max_rules = result_df['rule_count'].max()
-                    
-                    min_pps = result_df.loc[result_df['rule_count'] == min_rules, 'avg_pps'].values[0]
-                    max_pps = result_df.loc[result_df['rule_count'] == max_rules, 'avg_pps'].values[0]
-                    
-                    pps_reduction = (1 - max_pps / min_pps) * 100
-                    
-                    f.write(f"\nPerformance reduction from {min_rules} rules to {max_rules} rules: **{pps_reduction:.2f}%**\n\n")
-                
-                f.write("\n![Rule Scaling](rule_scaling.png)\n\n")
-        else:
-            f.write("No rule scaling test results found.\n\n")
+        parts.append("### Summary\n\n")
+        parts.append("The impact of increasing filter rules on performance:\n\n")
         
-        f.write("## WASM Module Overhead Test\n\n")
+        table = pd.DataFrame({
+            'Rule Count': result_df['rule_count'],
+            'Throughput (Mpps)': result_df['avg_pps'] / 1e6,
+            'Bandwidth (Gbps)': result_df['avg_mbps'] / 1e3,
+        })
+        parts.append(table.to_markdown(index=False, floatfmt=('.0f', '.2f', '.2f')) + "\n")
         
-        # WASM 오버헤드 테스트 결과 로드
-        wasm_files = glob.glob(os.path.join(args.results_dir, 'wasm_*_stats.csv'))
-        if wasm_files:
-            f.write("### Summary\n\n")
-            f.write("The impact of WASM modules on performance:\n\n")
+        # 성능 영향 계산
+        if len(result_df) > 1:
+            min_rules = result_df['rule_count'].min()
+            max_rules = result_df['rule_count'].max()
             
-            # 결과 처리를 위한 코드 (이전에 작성한 분석 코드 활용)
-            results = []
-            for file in wasm_files:
-                try:
-                    module_name = Path(file).stem.split('_')[1]
-                    if module_name == "none":
-                        module_name = "No WASM"
-                    elif module_name == "null":
-                        module_name = "Null Module"
-                    elif module_name.endswith(".wasm"):
-                        module_name = module_name[:-5].replace("_", " ").title()
-                    
-                    df = pd.read_csv(file)
-                    results.append({
-                        'module': module_name,
-                        'avg_pps': df['packets_per_sec'].mean() if 'packets_per_sec' in df.columns else 0,
-                        'avg_mbps': df['mbps'].mean() if 'mbps' in df.columns else 0,
-                        'avg_cpu': df['cpu_util'].mean() if 'cpu_util' in df.columns else 0,
-                    })
-                except (IndexError, ValueError):
-                    continue
+            min_pps = result_df.loc[result_df['rule_count'] == min_rules, 'avg_pps'].values[0]
+            max_pps = result_df.loc[result_df['rule_count'] == max_rules, 'avg_pps'].values[0]
             
-            if results:
-                result_df = pd.DataFrame(results)
-                
-                f.write("| WASM Module | Throughput (Mpps) | Bandwidth (Gbps) | CPU Utilization (%) |\n")
-                f.write("|-------------|-------------------|------------------|---------------------|\n")
-                
-                for _, row in result_df.iterrows():
-                    f.write(f"| {row['module']:11} | {row['avg_pps']/1e6:17.2f} | {row['avg_mbps']/1e3:16.2f} | {row['avg_cpu']:19.2f} |\n")
-                
-                # WASM 오버헤드 계산
-                if 'No WASM' in result_df['module'].values:
-                    no_wasm = result_df.loc[result_df['module'] == 'No WASM'].iloc[0]
-                    
-                    f.write("\n### WASM Module Overhead\n\n")
-                    for _, row in result_df[result_df['module'] != 'No WASM'].iterrows():
-                        pps_overhead = ((no_wasm['avg_pps'] - row['avg_pps']) / no_wasm['avg_pps']) * 100
-                        
-                        f.write(f"- **{row['module']}**: {pps_overhead:.2f}% throughput reduction\n")
-                
-                f.write("\n![WASM Overhead](wasm_overhead.png)\n\n")
-        else:
-            f.write("No WASM overhead test results found.\n\n")
+            pps_reduction = (1 - max_pps / min_pps) * 100
+            
+            parts.append(f"\nPerformance reduction from {min_rules} rules to {max_rules} rules: **{pps_reduction:.2f}%**\n\n")
+        
+        parts.append("\n![Rule Scaling](rule_scaling.png)\n\n")
+    else:
+        parts.append("No rule scaling test results found.\n\n")
+    
+    parts.append("## WASM Module Overhead Test\n\n")
+    
+    # WASM 오버헤드 테스트 결과
+    if wasm_df is not None:
+        result_df = wasm_df
+        
+        parts.append("### Summary\n\n")
+        parts.append("The impact of WASM modules on performance:\n\n")
         
-        f.write("## Solution Comparison\n\n")
-        f.write("Comparison of Swift-Guard with other network security solutions:\n\n")
-        f.write("![Solution Comparison](solution_comparison.png)\n\n")
+        table = pd.DataFrame({
+            'WASM Module': result_df['module'],
+            'Throughput (Mpps)': result_df['avg_pps'] / 1e6,
+            'Bandwidth (Gbps)': result_df['avg_mbps'] / 1e3,
+            'CPU Utilization (%)': result_df['avg_cpu'],
+        })
+        parts.append(table.to_markdown(index=False, floatfmt='.2f') + "\n")
         
-        f.write("## Conclusion\n\n")
-        f.write("Swift-Guard demonstrates high-performance packet processing capabilities with minimal overhead, even when using WebAssembly modules for advanced security inspection. The combination of XDP's wire-speed packet handling and WASM's flexibility creates a powerful framework for next-generation network security applications.\n\n")
+        # WASM 오버헤드 계산
+        if 'overhead_pct' in result_df.columns:
+            parts.append("\n### WASM Module Overhead\n\n")
+            for row in result_df[result_df['module'] != 'No WASM'].itertuples(index=False):
+                parts.append(f"- **{row.module}**: {row.overhead_pct:.2f}% throughput reduction\n")
         
-        f.write("The performance results show that Swift-Guard can achieve throughput suitable for production environments, with scalable rule management and efficient resource utilization. Further optimizations could potentially improve these results even more in future versions.\n")
+        parts.append("\n![WASM Overhead](wasm_overhead.png)\n\n")
+    else:
+        parts.append("No WASM overhead test results found.\n\n")
+    
+    parts.append("## Solution Comparison\n\n")
+    parts.append("Comparison of Swift-Guard with other network security solutions:\n\n")
+    parts.append("![Solution Comparison](solution_comparison.png)\n\n")
+    
+    parts.append("## Conclusion\n\n")
+    parts.append("Swift-Guard demonstrates high-performance packet processing capabilities with minimal overhead, even when using WebAssembly modules for advanced security inspection. The combination of XDP's wire-speed packet handling and WASM's flexibility creates a powerful framework for next-generation network security applications.\n\n")
+    
+    parts.append("The performance results show that Swift-Guard can achieve throughput suitable for production environments, with scalable rule management and efficient resource utilization. Further optimizations could potentially improve these results even more in future versions.\n")
+    
+    with open(report_file, 'w', buffering=1 << 16) as f:
+        f.write(''.join(parts))
     
     print(f"Generated summary report: {report_file}")
 
 # 주요 함수 실행
 if __name__ == "__main__":
-    analyze_basic_throughput()
-    analyze_rule_scaling()
-    analyze_wasm_overhead()
+    throughput_df = analyze_basic_throughput()
+    rule_df = analyze_rule_scaling()
+    wasm_df = analyze_wasm_overhead()
     create_solution_comparison()
-    generate_summary_report()
+    generate_summary_report(throughput_df, rule_df, wasm_df)
     
     print(f"\nAll analysis completed. Results saved to {args.output_dir}")